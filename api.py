@@ -0,0 +1,358 @@
+"""database.py 기능을 JSON으로 노출하는 경량 HTTP API (Streamlit 없이 실행)
+
+사용법:
+    python api.py                      → http://127.0.0.1:8600
+    python api.py --host 0.0.0.0 --port 8600
+
+인증: 모든 요청에 `Authorization: Bearer <APP_PASSWORD>` 헤더가 필요합니다.
+
+엔드포인트:
+    GET   /tasks?category=&project_id=&status=&order_by=&limit=&offset=
+          (Accept: application/x-ndjson 또는 format=ndjson → 한 줄에 한 태스크씩 스트리밍)
+    POST  /tasks                    태스크 목록 일괄 추가 → {"ids": [...]}
+    PATCH /tasks                    id와 바꿀 필드만 담은 목록으로 일괄 수정 → {"updated": n}
+    GET   /projects/<id>/progress   프로젝트 진행률
+    GET   /stats                    전체 요약 지표
+"""
+import argparse
+import asyncio
+import hmac
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import asdict, fields
+from datetime import date
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from database import (
+    init_db, add_tasks, get_task, get_tasks, get_task_ids, get_tasks_by_ids, update_tasks,
+    get_project_progress, get_task_stats,
+)
+from models import Task, CATEGORIES, PRIORITIES, URGENCIES, STATUSES
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+STREAM_PAGE_SIZE = 500
+MAX_BODY_SIZE = 10 * 1024 * 1024
+TASK_FIELDS = {f.name for f in fields(Task)}
+# quadrant는 DB가 계산하고, template_id는 반복 생성 시에만 설정됨
+READ_ONLY_FIELDS = ("created_at", "quadrant", "template_id")
+CHOICE_FIELDS = {
+    "category": CATEGORIES,
+    "priority": PRIORITIES,
+    "urgency": URGENCIES,
+    "status": STATUSES,
+}
+ORDER_BY_OPTIONS = ("due_date", "priority", "quadrant", "created_at")
+
+REASONS = {
+    200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized",
+    404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class StreamAborted(Exception):
+    """chunked 응답 헤더를 보낸 뒤 실패 → 연결을 끊는 것 외에는 알릴 방법이 없음"""
+
+
+# --- 직렬화 ---
+
+def task_to_json(task: Task) -> dict:
+    data = asdict(task)
+    if task.due_date:
+        data["due_date"] = task.due_date.isoformat()
+    if task.created_at is not None:
+        data["created_at"] = str(task.created_at)
+    return data
+
+
+def task_from_json(data: dict, require_id: bool = False) -> Task:
+    if not isinstance(data, dict):
+        raise HTTPError(400, "태스크는 JSON 객체여야 합니다.")
+    unknown = set(data) - TASK_FIELDS
+    if unknown:
+        raise HTTPError(400, f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+    values = {k: v for k, v in data.items() if k not in READ_ONLY_FIELDS}
+    if require_id and not _is_int(values.get("id")):
+        raise HTTPError(400, "수정할 태스크에는 정수 id가 필요합니다.")
+    if not require_id:
+        values.pop("id", None)
+        if "title" not in values:
+            raise HTTPError(400, "title은 필수입니다.")
+    if "title" in values and not (isinstance(values["title"], str) and values["title"].strip()):
+        raise HTTPError(400, "title은 비어 있지 않은 문자열이어야 합니다.")
+    if "description" in values and not isinstance(values["description"], str):
+        raise HTTPError(400, "description은 문자열이어야 합니다.")
+    if values.get("project_id") is not None and not _is_int(values["project_id"]):
+        raise HTTPError(400, "project_id는 정수 또는 null이어야 합니다.")
+    for key, choices in CHOICE_FIELDS.items():
+        if key in values and values[key] not in choices:
+            raise HTTPError(400, f"{key}는 {', '.join(choices)} 중 하나여야 합니다.")
+    if values.get("due_date"):
+        try:
+            values["due_date"] = date.fromisoformat(values["due_date"])
+        except (TypeError, ValueError):
+            raise HTTPError(400, f"잘못된 due_date: {values['due_date']!r}")
+    return Task(**values)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _parse_task_list(body: bytes) -> list:
+    try:
+        payload = json.loads(body or b"null")
+    except json.JSONDecodeError:
+        raise HTTPError(400, "본문이 올바른 JSON이 아닙니다.")
+    if isinstance(payload, dict) and "tasks" in payload:
+        payload = payload["tasks"]
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list):
+        raise HTTPError(400, "태스크 객체 또는 목록을 보내주세요.")
+    return payload
+
+
+def _apply_patches(items: list) -> int:
+    """보낸 필드만 기존 값 위에 덮어써서 일괄 수정 (없는 id는 건너뜀)"""
+    patched = []
+    for item in items:
+        partial = task_from_json(item, require_id=True)
+        current = get_task(partial.id)
+        if current is None:
+            continue
+        for key in item:
+            if key != "id" and key not in READ_ONLY_FIELDS:
+                setattr(current, key, getattr(partial, key))
+        patched.append(current)
+    return update_tasks(patched) if patched else 0
+
+
+def _int_param(query: dict, key: str) -> Optional[int]:
+    if key not in query:
+        return None
+    try:
+        return int(query[key][0])
+    except ValueError:
+        raise HTTPError(400, f"{key}는 정수여야 합니다.")
+
+
+def _task_filters(query: dict) -> dict:
+    order_by = query.get("order_by", ["due_date"])[0]
+    if order_by not in ORDER_BY_OPTIONS:
+        raise HTTPError(400, f"order_by는 {', '.join(ORDER_BY_OPTIONS)} 중 하나여야 합니다.")
+    return {
+        "category": query.get("category", [None])[0],
+        "project_id": _int_param(query, "project_id"),
+        "status": query.get("status", [None])[0],
+        "order_by": order_by,
+    }
+
+
+# --- HTTP 처리 ---
+
+async def _read_request(reader: asyncio.StreamReader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "잘못된 요청 라인입니다.")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(400, "잘못된 Content-Length입니다.")
+    if length < 0:
+        raise HTTPError(400, "잘못된 Content-Length입니다.")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(413, "요청 본문이 너무 큽니다.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    writer.write(
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+        + body
+    )
+
+
+async def _stream_tasks(writer: asyncio.StreamWriter, filters: dict, limit: Optional[int], offset: int,
+                        keep_alive: bool):
+    """대량 조회를 NDJSON chunked 응답으로 흘려보냄
+
+    시작 시점의 id 순서를 한 번에 잡아 두고 그 id들을 페이지 단위로 읽으므로,
+    스트리밍 중 태스크가 추가돼도 중복·누락이 없고 OFFSET 재조회도 하지 않음.
+    """
+    writer.write(
+        "HTTP/1.1 200 OK\r\n"
+        "Content-Type: application/x-ndjson; charset=utf-8\r\n"
+        "Transfer-Encoding: chunked\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+    )
+    try:
+        ids = await asyncio.to_thread(get_task_ids, **filters, limit=limit, offset=offset)
+        for start in range(0, len(ids), STREAM_PAGE_SIZE):
+            page = await asyncio.to_thread(get_tasks_by_ids, ids[start:start + STREAM_PAGE_SIZE])
+            if page:
+                chunk = "".join(
+                    json.dumps(task_to_json(t), ensure_ascii=False) + "\n" for t in page
+                ).encode("utf-8")
+                writer.write(f"{len(chunk):X}\r\n".encode("latin-1") + chunk + b"\r\n")
+                await writer.drain()
+    except Exception as e:
+        raise StreamAborted() from e
+    writer.write(b"0\r\n\r\n")
+
+
+async def _write_db(func, *args):
+    """존재하지 않는 project_id 등 제약 조건 위반은 클라이언트 오류(400)로 변환"""
+    try:
+        return await asyncio.to_thread(func, *args)
+    except sqlite3.IntegrityError:
+        raise HTTPError(400, "제약 조건 위반: project_id가 없거나 같은 반복 태스크가 그 날짜에 이미 있습니다.")
+
+
+async def _dispatch(method: str, target: str, headers: dict, body: bytes,
+                    writer: asyncio.StreamWriter, keep_alive: bool):
+    url = urlsplit(target)
+    query = parse_qs(url.query)
+    parts = [p for p in url.path.split("/") if p]
+
+    if parts == ["tasks"]:
+        if method == "GET":
+            filters = _task_filters(query)
+            limit = _int_param(query, "limit")
+            offset = _int_param(query, "offset") or 0
+            wants_ndjson = (
+                query.get("format", [""])[0] == "ndjson"
+                or "application/x-ndjson" in headers.get("accept", "")
+            )
+            if wants_ndjson:
+                await _stream_tasks(writer, filters, limit, offset, keep_alive)
+                return
+            tasks = await asyncio.to_thread(get_tasks, **filters, limit=limit, offset=offset)
+            _write_response(writer, 200, {"tasks": [task_to_json(t) for t in tasks]}, keep_alive)
+            return
+        if method == "POST":
+            tasks = [task_from_json(item) for item in _parse_task_list(body)]
+            ids = await _write_db(add_tasks, tasks)
+            _write_response(writer, 201, {"ids": ids}, keep_alive)
+            return
+        if method == "PATCH":
+            updated = await _write_db(_apply_patches, _parse_task_list(body))
+            _write_response(writer, 200, {"updated": updated}, keep_alive)
+            return
+        raise HTTPError(405, "지원하지 않는 메서드입니다.")
+
+    if len(parts) == 3 and parts[0] == "projects" and parts[2] == "progress":
+        if method != "GET":
+            raise HTTPError(405, "지원하지 않는 메서드입니다.")
+        try:
+            project_id = int(parts[1])
+        except ValueError:
+            raise HTTPError(404, "프로젝트를 찾을 수 없습니다.")
+        progress = await asyncio.to_thread(get_project_progress, project_id)
+        _write_response(writer, 200, progress, keep_alive)
+        return
+
+    if parts == ["stats"]:
+        if method != "GET":
+            raise HTTPError(405, "지원하지 않는 메서드입니다.")
+        _write_response(writer, 200, await asyncio.to_thread(get_task_stats), keep_alive)
+        return
+
+    raise HTTPError(404, "존재하지 않는 경로입니다.")
+
+
+def make_handler(token: str):
+    expected = f"Bearer {token}".encode()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    if not hmac.compare_digest(headers.get("authorization", "").encode("latin-1"), expected):
+                        raise HTTPError(401, "인증이 필요합니다.")
+                    await _dispatch(method, target, headers, body, writer, keep_alive)
+                except HTTPError as e:
+                    _write_response(writer, e.status, {"error": e.message}, keep_alive)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except StreamAborted:
+                    logger.exception("스트리밍 중 오류로 연결을 끊음")
+                    break
+                except Exception:
+                    # 내부 메시지(SQLite 오류 등)는 클라이언트에 보내지 않고 서버 로그에만 남김
+                    logger.exception("요청 처리 중 오류")
+                    _write_response(writer, 500, {"error": "서버 내부 오류입니다."}, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve(host: str, port: int, token: str):
+    init_db()
+    server = await asyncio.start_server(make_handler(token), host, port)
+    print(f"📡 API 서버 실행 중: http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="태스크 JSON API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    token = os.getenv("APP_PASSWORD", "admin1234")
+    try:
+        asyncio.run(serve(args.host, args.port, token))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 import streamlit as st
 import os
+import sqlite3
 import plotly.graph_objects as go
 from datetime import date
 from database import (
     init_db, add_task, get_tasks, update_task, delete_task,
     add_project, get_projects, delete_project, get_project_progress,
+    find_similar_tasks, find_duplicate_groups,
+    add_template, get_templates, delete_template, materialize_recurring_tasks,
 )
-from models import Task
-from ai_classifier import classify_task
+from models import Task, RecurringTemplate
+import recurrence
 
 # .env 파일 (로컬) 또는 Streamlit Cloud secrets 지원
 try:
@@ -23,9 +26,21 @@ def get_secret(key: str, default: str = "") -> str:
     except (KeyError, FileNotFoundError):
         return os.getenv(key, default)
 
+
+@st.cache_resource
+def ensure_db() -> bool:
+    """스키마 생성은 프로세스당 한 번만 실행 (rerun마다 DDL 방지)"""
+    init_db()
+    return True
+
+
+@st.cache_data(ttl=3600)
+def materialize_for(today: date) -> int:
+    """반복 태스크 생성은 하루(또는 한 시간) 단위로 한 번만 실행"""
+    return materialize_recurring_tasks(today=today)
+
 # --- 초기 설정 ---
 st.set_page_config(page_title="프로젝트 관리 에이전트", page_icon="📋", layout="wide")
-init_db()
 
 # --- 모바일 반응형 CSS ---
 st.markdown("""
@@ -93,6 +108,10 @@ def check_password() -> bool:
 if not check_password():
     st.stop()
 
+# 로그인 화면에서는 DB를 건드리지 않도록 인증 이후에 초기화
+ensure_db()
+materialize_for(date.today())
+
 # --- 로그아웃 버튼 ---
 with st.sidebar:
     if st.button("🚪 로그아웃", use_container_width=True):
@@ -234,6 +253,7 @@ with tab_tasks:
                 for p in projects:
                     project_options[p.name] = p.id
                 proj = st.selectbox("프로젝트", list(project_options.keys()), key="add_proj")
+                allow_duplicate = st.checkbox("유사 태스크가 있어도 추가", value=False)
             with form_col2:
                 auto_classify = st.checkbox("AI 자동 분류", value=True)
                 manual_category = st.selectbox("카테고리", ["업무", "개인"], key="add_cat")
@@ -241,29 +261,28 @@ with tab_tasks:
                 manual_urgency = st.selectbox("긴급도", ["긴급", "보통", "여유"], key="add_urg")
 
             submitted = st.form_submit_button("추가", use_container_width=True)
-            if submitted and title:
+            # AI 분류 호출 전에 중복 여부부터 확인
+            duplicates = []
+            if submitted and title and not allow_duplicate:
+                duplicates = find_similar_tasks(title, description)
+            if duplicates:
+                st.warning("비슷한 태스크가 이미 있습니다. 그래도 추가하려면 '유사 태스크가 있어도 추가'를 체크하세요.")
+                for d, score in duplicates:
+                    st.markdown(f"- {d.title} ({d.status}, 유사도 {score * 100:.0f}%)")
+            elif submitted and title:
                 if auto_classify:
+                    # openai 의존성은 분류 요청 시에만 로드
+                    from ai_classifier import classify_task
                     with st.spinner("AI가 분류 중..."):
                         result = classify_task(title, description)
                     cat = result["category"]
                     pri = result["priority"]
                     urg = result["urgency"]
-                    quad = result["quadrant"]
-                    st.info(f"AI 분류 결과: {cat} | {pri} | {urg} | 사분면 {quad}")
+                    st.info(f"AI 분류 결과: {cat} | {pri} | {urg}")
                 else:
                     cat = manual_category
                     pri = manual_priority
                     urg = manual_urgency
-                    is_urgent = urg == "긴급"
-                    is_important = pri == "높음"
-                    if is_urgent and is_important:
-                        quad = 1
-                    elif not is_urgent and is_important:
-                        quad = 2
-                    elif is_urgent and not is_important:
-                        quad = 3
-                    else:
-                        quad = 4
 
                 new_task = Task(
                     title=title,
@@ -271,7 +290,6 @@ with tab_tasks:
                     category=cat,
                     priority=pri,
                     urgency=urg,
-                    quadrant=quad,
                     project_id=project_options[proj],
                     due_date=due,
                 )
@@ -281,6 +299,93 @@ with tab_tasks:
             elif submitted and not title:
                 st.warning("제목을 입력해주세요.")
 
+    # 반복 태스크 템플릿
+    with st.expander("🔁 반복 태스크", expanded=False):
+        with st.form("add_template_form"):
+            rt_title = st.text_input("제목 *", key="rt_title")
+            rt_desc = st.text_area("설명", key="rt_desc")
+
+            rt_col1, rt_col2 = st.columns(2)
+            with rt_col1:
+                rt_freq = st.selectbox("반복", ["매주", "매월", "매일"], key="rt_freq")
+                rt_days = st.multiselect("요일 (매주)", recurrence.WEEKDAY_LABELS, key="rt_days")
+                rt_monthday = st.number_input("날짜 (매월, -1은 말일)", -1, 31, 1, key="rt_monthday")
+                rt_start = st.date_input("시작일", value=date.today(), key="rt_start")
+                rt_rrule = st.text_input("고급: 규칙 직접 입력", placeholder="FREQ=WEEKLY;INTERVAL=2;BYDAY=MO", key="rt_rrule")
+            with rt_col2:
+                rt_proj = st.selectbox("프로젝트", list(project_options.keys()), key="rt_proj")
+                rt_auto = st.checkbox("AI 자동 분류 (템플릿당 1회)", value=True, key="rt_auto")
+                rt_cat = st.selectbox("카테고리", ["업무", "개인"], key="rt_cat")
+                rt_pri = st.selectbox("중요도", ["높음", "중간", "낮음"], key="rt_pri")
+                rt_urg = st.selectbox("긴급도", ["긴급", "보통", "여유"], key="rt_urg")
+
+            if st.form_submit_button("템플릿 추가", use_container_width=True):
+                if rt_rrule.strip():
+                    rrule = rt_rrule.strip()
+                elif rt_freq == "매주":
+                    byday = ",".join(recurrence.WEEKDAYS[recurrence.WEEKDAY_LABELS.index(d)] for d in rt_days)
+                    rrule = f"FREQ=WEEKLY;BYDAY={byday}" if byday else "FREQ=WEEKLY"
+                elif rt_freq == "매월":
+                    rrule = f"FREQ=MONTHLY;BYMONTHDAY={rt_monthday}" if rt_monthday else "FREQ=MONTHLY"
+                else:
+                    rrule = "FREQ=DAILY"
+
+                try:
+                    recurrence.parse_rule(rrule)
+                except ValueError as e:
+                    st.warning(f"반복 규칙 오류: {e}")
+                else:
+                    if not rt_title:
+                        st.warning("제목을 입력해주세요.")
+                    else:
+                        if rt_auto:
+                            from ai_classifier import classify_task
+                            with st.spinner("AI가 분류 중..."):
+                                result = classify_task(rt_title, rt_desc)
+                            cat, pri, urg = result["category"], result["priority"], result["urgency"]
+                        else:
+                            cat, pri, urg = rt_cat, rt_pri, rt_urg
+                        tid = add_template(RecurringTemplate(
+                            title=rt_title,
+                            description=rt_desc,
+                            category=cat,
+                            priority=pri,
+                            urgency=urg,
+                            project_id=project_options[rt_proj],
+                            rrule=rrule,
+                            start_date=rt_start,
+                        ))
+                        materialize_recurring_tasks(template_ids=[tid])
+                        st.success("반복 태스크가 추가되었습니다!")
+                        st.rerun()
+
+        templates = get_templates()
+        if templates:
+            st.divider()
+            for tpl in templates:
+                rt_info_col, rt_btn_col = st.columns([4, 1])
+                with rt_info_col:
+                    rule_text = recurrence.describe(recurrence.parse_rule(tpl.rrule), tpl.start_date)
+                    st.markdown(f"**{tpl.title}** | {rule_text} | {tpl.category} | {tpl.priority}")
+                with rt_btn_col:
+                    if st.button("삭제", key=f"delt_{tpl.id}", use_container_width=True, type="secondary"):
+                        delete_template(tpl.id)
+                        st.rerun()
+        else:
+            st.caption("등록된 반복 태스크가 없습니다.")
+
+    # 중복 의심 태스크 리포트
+    with st.expander("🔁 중복 의심 태스크", expanded=False):
+        if st.button("전체 DB 검사", key="dedupe_report", use_container_width=True):
+            groups = find_duplicate_groups()
+            if groups:
+                st.caption(f"중복 의심 묶음 {len(groups)}개 / 태스크 {sum(len(g) for g in groups)}개")
+                for g in groups:
+                    st.markdown(f"**{g[0].title}** ×{len(g)}")
+                    st.caption(", ".join(f"#{t.id} {t.status}" for t in g))
+            else:
+                st.success("중복 의심 태스크가 없습니다!")
+
     # 태스크 목록
     st.divider()
     if not tasks:
@@ -340,12 +445,13 @@ with tab_tasks:
                         t.priority = new_pri
                         t.urgency = new_urg
                         t.due_date = new_due
-                        is_u = new_urg == "긴급"
-                        is_i = new_pri == "높음"
-                        t.quadrant = 1 if is_u and is_i else 2 if not is_u and is_i else 3 if is_u else 4
-                        update_task(t)
-                        st.success("저장 완료!")
-                        st.rerun()
+                        try:
+                            update_task(t)
+                        except sqlite3.IntegrityError:
+                            st.error("같은 반복 태스크가 이미 그 날짜에 있습니다. 다른 마감일을 선택해주세요.")
+                        else:
+                            st.success("저장 완료!")
+                            st.rerun()
                 with btn_col2:
                     if st.button("삭제", key=f"del_{t.id}", use_container_width=True, type="secondary"):
                         delete_task(t.id)
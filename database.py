@@ -1,7 +1,10 @@
 import sqlite3
-from datetime import datetime, date
+from contextlib import closing
+from datetime import datetime, date, timedelta
 from typing import Optional
-from models import Task, Project
+from models import Task, Project, RecurringTemplate, PRIORITIES, URGENCIES
+import recurrence
+import similarity
 
 DB_PATH = "tasks.db"
 
@@ -13,9 +16,63 @@ def get_conn() -> sqlite3.Connection:
     return conn
 
 
+# 중요도/긴급도 순위와 사분면은 DB가 직접 계산 (입력 경로마다 값이 달라지지 않도록)
+_TASKS_TABLE = """
+        CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            category TEXT DEFAULT '업무',
+            priority TEXT DEFAULT '중간' CHECK (priority IN ('높음', '중간', '낮음')),
+            urgency TEXT DEFAULT '보통' CHECK (urgency IN ('긴급', '보통', '여유')),
+            project_id INTEGER,
+            due_date DATE,
+            status TEXT DEFAULT '진행전',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            template_id INTEGER REFERENCES recurring_templates(id) ON DELETE SET NULL,
+            priority_rank INTEGER GENERATED ALWAYS AS (
+                CASE priority WHEN '높음' THEN 1 WHEN '중간' THEN 2 ELSE 3 END
+            ) VIRTUAL,
+            urgency_rank INTEGER GENERATED ALWAYS AS (
+                CASE urgency WHEN '긴급' THEN 1 WHEN '보통' THEN 2 ELSE 3 END
+            ) VIRTUAL,
+            quadrant INTEGER GENERATED ALWAYS AS (
+                CASE
+                    WHEN priority = '높음' AND urgency = '긴급' THEN 1
+                    WHEN priority = '높음' THEN 2
+                    WHEN urgency = '긴급' THEN 3
+                    ELSE 4
+                END
+            ) STORED,
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
+        );
+"""
+
+
+def _rebuild_tasks_table(conn: sqlite3.Connection):
+    """quadrant가 일반 컬럼인 이전 스키마를 생성 컬럼 스키마로 옮김 (SQLite 테이블 재생성 절차)"""
+    conn.commit()
+    conn.executescript(f"""
+        PRAGMA foreign_keys = OFF;
+        BEGIN;
+        {_TASKS_TABLE.format(name="tasks_new")}
+        INSERT INTO tasks_new (id, title, description, category, priority, urgency,
+                               project_id, due_date, status, created_at, template_id)
+        SELECT id, title, description, category,
+               CASE WHEN priority IN ('높음', '중간', '낮음') THEN priority ELSE '중간' END,
+               CASE WHEN urgency IN ('긴급', '보통', '여유') THEN urgency ELSE '보통' END,
+               project_id, due_date, status, created_at, template_id
+        FROM tasks;
+        DROP TABLE tasks;
+        ALTER TABLE tasks_new RENAME TO tasks;
+        COMMIT;
+        PRAGMA foreign_keys = ON;
+    """)
+
+
 def init_db():
     conn = get_conn()
-    conn.executescript("""
+    conn.executescript(_TASKS_TABLE.format(name="tasks") + """
         CREATE TABLE IF NOT EXISTS projects (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -23,21 +80,83 @@ def init_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
-        CREATE TABLE IF NOT EXISTS tasks (
+        CREATE TABLE IF NOT EXISTS recurring_templates (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             description TEXT DEFAULT '',
             category TEXT DEFAULT '업무',
-            priority TEXT DEFAULT '중간',
-            urgency TEXT DEFAULT '보통',
-            quadrant INTEGER DEFAULT 4,
+            priority TEXT DEFAULT '중간' CHECK (priority IN ('높음', '중간', '낮음')),
+            urgency TEXT DEFAULT '보통' CHECK (urgency IN ('긴급', '보통', '여유')),
             project_id INTEGER,
-            due_date DATE,
-            status TEXT DEFAULT '진행전',
+            rrule TEXT NOT NULL,
+            start_date DATE NOT NULL,
+            materialized_until DATE,
+            active INTEGER DEFAULT 1,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
         );
+
+        -- 유사 태스크 탐지용 MinHash 시그니처와 LSH 버킷
+        CREATE TABLE IF NOT EXISTS task_signatures (
+            task_id INTEGER PRIMARY KEY,
+            signature BLOB NOT NULL,
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+        );
+
+        CREATE TABLE IF NOT EXISTS task_lsh (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            task_id INTEGER NOT NULL,
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+        );
+        CREATE INDEX IF NOT EXISTS idx_task_lsh_bucket ON task_lsh (band, bucket);
+        CREATE INDEX IF NOT EXISTS idx_task_lsh_task ON task_lsh (task_id);
+    """)
+    # 이전 버전 DB 마이그레이션 (생성 컬럼은 table_info에 나오지 않으므로 table_xinfo 사용)
+    columns = {r["name"] for r in conn.execute("PRAGMA table_xinfo(tasks)")}
+    if "template_id" not in columns:
+        conn.execute(
+            "ALTER TABLE tasks ADD COLUMN template_id INTEGER "
+            "REFERENCES recurring_templates(id) ON DELETE SET NULL"
+        )
+    if "priority_rank" not in columns:
+        _rebuild_tasks_table(conn)
+    conn.executescript("""
+        -- 같은 템플릿의 같은 날짜 태스크는 한 번만 생성 (반복 생성의 멱등성 보장)
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_template_due
+            ON tasks (template_id, due_date) WHERE template_id IS NOT NULL;
+
+        -- get_tasks 정렬 옵션별 인덱스 (ORDER BY 식과 정확히 같아야 임시 B-tree 없이 사용됨)
+        CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks (due_date IS NULL, due_date);
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority_rank ON tasks (priority_rank);
+        CREATE INDEX IF NOT EXISTS idx_tasks_quadrant ON tasks (quadrant);
+        CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at);
     """)
+    # LSH 밴드 구성이 바뀌었으면 저장된 시그니처로 버킷을 다시 만듦
+    max_band = conn.execute("SELECT MAX(band) FROM task_lsh").fetchone()[0]
+    if max_band is not None and max_band != similarity.BANDS - 1:
+        conn.execute("DELETE FROM task_lsh")
+        conn.executemany(
+            "INSERT INTO task_lsh (band, bucket, task_id) VALUES (?, ?, ?)",
+            [
+                (band, key, r["task_id"])
+                for r in conn.execute("SELECT task_id, signature FROM task_signatures").fetchall()
+                for band, key in enumerate(similarity.band_keys(similarity.unpack(r["signature"])))
+            ],
+        )
+    # 글자 없는 제목(이모지·문장부호만)에 저장됐던 상수 시그니처는 모든 태스크와 일치하므로 제거
+    conn.execute(
+        "DELETE FROM task_signatures WHERE signature = ?",
+        (similarity.pack([similarity.MAX_HASH] * similarity.NUM_PERM),),
+    )
+    conn.execute("DELETE FROM task_lsh WHERE task_id NOT IN (SELECT task_id FROM task_signatures)")
+    # 기능 도입 이전에 만들어진 태스크도 색인 (반복 생성분은 중복 탐지 대상에서 제외)
+    missing = conn.execute(
+        """SELECT id, title, description FROM tasks
+           WHERE template_id IS NULL AND id NOT IN (SELECT task_id FROM task_signatures)"""
+    ).fetchall()
+    entries = [(r["id"], _compute_index(Task(title=r["title"], description=r["description"]))) for r in missing]
+    _write_index(conn, [(tid, index) for tid, index in entries if index is not None])
     conn.commit()
     conn.close()
 
@@ -96,41 +215,94 @@ def _row_to_task(r) -> Task:
         due_date=due,
         status=r["status"],
         created_at=r["created_at"],
+        template_id=r["template_id"],
     )
 
 
-def add_task(task: Task) -> int:
-    conn = get_conn()
-    cur = conn.execute(
-        """INSERT INTO tasks (title, description, category, priority, urgency,
-           quadrant, project_id, due_date, status)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            task.title,
-            task.description,
-            task.category,
-            task.priority,
-            task.urgency,
-            task.quadrant,
-            task.project_id,
-            task.due_date.isoformat() if task.due_date else None,
-            task.status,
-        ),
+def _task_params(task: Task) -> tuple:
+    return (
+        task.title,
+        task.description,
+        task.category,
+        task.priority,
+        task.urgency,
+        task.project_id,
+        task.due_date.isoformat() if task.due_date else None,
+        task.status,
+        task.template_id,
     )
-    conn.commit()
-    tid = cur.lastrowid
-    conn.close()
-    return tid
 
 
-def get_tasks(
-    category: Optional[str] = None,
-    project_id: Optional[int] = None,
-    status: Optional[str] = None,
-    order_by: str = "due_date",
-) -> list[Task]:
-    conn = get_conn()
-    query = "SELECT * FROM tasks WHERE 1=1"
+# quadrant는 생성 컬럼이라 쓰지 않음
+_INSERT_TASK = """INSERT INTO tasks (title, description, category, priority, urgency,
+           project_id, due_date, status, template_id)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_UPDATE_TASK = """UPDATE tasks SET title=?, description=?, category=?, priority=?,
+           urgency=?, project_id=?, due_date=?, status=?, template_id=?
+           WHERE id=?"""
+
+
+def _compute_index(task: Task) -> Optional[tuple[bytes, list[int]]]:
+    """MinHash 시그니처와 LSH 버킷 키 (반복 생성 태스크, 글자가 없는 제목은 색인하지 않음)
+
+    계산 비용이 커서 쓰기 잠금을 잡기 전에 미리 구해 둡니다.
+    """
+    if task.template_id is not None:
+        return None
+    sig = similarity.signature(similarity.task_text(task.title, task.description))
+    if sig is None:
+        return None
+    return similarity.pack(sig), similarity.band_keys(sig)
+
+
+def _write_index(conn: sqlite3.Connection, entries: list[tuple[int, Optional[tuple[bytes, list[int]]]]]):
+    """색인 갱신. index가 None이면 남아 있던 색인을 지움 (수정으로 색인 대상에서 빠진 경우)"""
+    conn.executemany("DELETE FROM task_lsh WHERE task_id = ?", [(tid,) for tid, _ in entries])
+    conn.executemany(
+        "DELETE FROM task_signatures WHERE task_id = ?",
+        [(tid,) for tid, index in entries if index is None],
+    )
+    indexed = [(tid, *index) for tid, index in entries if index is not None]
+    conn.executemany(
+        "INSERT OR REPLACE INTO task_signatures (task_id, signature) VALUES (?, ?)",
+        [(tid, blob) for tid, blob, _ in indexed],
+    )
+    conn.executemany(
+        "INSERT INTO task_lsh (band, bucket, task_id) VALUES (?, ?, ?)",
+        [(band, key, tid) for tid, _, keys in indexed for band, key in enumerate(keys)],
+    )
+
+
+def add_task(task: Task) -> int:
+    return add_tasks([task])[0]
+
+
+def add_tasks(tasks: list[Task]) -> list[int]:
+    """여러 태스크를 하나의 트랜잭션으로 추가하고 생성된 id 목록을 반환"""
+    indexes = [_compute_index(t) for t in tasks]
+    ids, entries = [], []
+    # 제약 조건 위반 시에도 롤백 후 연결을 닫아 쓰기 잠금이 남지 않도록
+    with closing(get_conn()) as conn, conn:
+        for task, index in zip(tasks, indexes):
+            tid = conn.execute(_INSERT_TASK, _task_params(task)).lastrowid
+            if index is not None:
+                entries.append((tid, index))
+            ids.append(tid)
+        _write_index(conn, entries)
+    return ids
+
+
+def _task_query(
+    columns: str,
+    category: Optional[str],
+    project_id: Optional[int],
+    status: Optional[str],
+    order_by: str,
+    limit: Optional[int],
+    offset: int,
+) -> tuple[str, list]:
+    query = f"SELECT {columns} FROM tasks WHERE 1=1"
     params: list = []
 
     if category and category != "전체":
@@ -144,19 +316,63 @@ def get_tasks(
         params.append(status)
 
     if order_by == "due_date":
-        query += " ORDER BY CASE WHEN due_date IS NULL THEN 1 ELSE 0 END, due_date ASC"
+        query += " ORDER BY due_date IS NULL, due_date ASC"
     elif order_by == "priority":
-        query += " ORDER BY CASE priority WHEN '높음' THEN 1 WHEN '중간' THEN 2 WHEN '낮음' THEN 3 END"
+        query += " ORDER BY priority_rank ASC"
     elif order_by == "quadrant":
         query += " ORDER BY quadrant ASC"
     else:
         query += " ORDER BY created_at DESC"
 
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    return query, params
+
+
+def get_tasks(
+    category: Optional[str] = None,
+    project_id: Optional[int] = None,
+    status: Optional[str] = None,
+    order_by: str = "due_date",
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[Task]:
+    conn = get_conn()
+    query, params = _task_query("*", category, project_id, status, order_by, limit, offset)
     rows = conn.execute(query, params).fetchall()
     conn.close()
     return [_row_to_task(r) for r in rows]
 
 
+def get_task_ids(
+    category: Optional[str] = None,
+    project_id: Optional[int] = None,
+    status: Optional[str] = None,
+    order_by: str = "due_date",
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[int]:
+    """get_tasks와 같은 조건·순서의 id 목록 (인덱스만 읽음). 대량 조회를 한 시점 기준으로 나눠 읽을 때 사용"""
+    conn = get_conn()
+    query, params = _task_query("id", category, project_id, status, order_by, limit, offset)
+    ids = [r[0] for r in conn.execute(query, params)]
+    conn.close()
+    return ids
+
+
+def get_tasks_by_ids(task_ids: list[int]) -> list[Task]:
+    """주어진 id 순서대로 태스크 조회 (그 사이 삭제된 태스크는 빠짐)"""
+    if not task_ids:
+        return []
+    conn = get_conn()
+    placeholders = ",".join("?" * len(task_ids))
+    rows = conn.execute(f"SELECT * FROM tasks WHERE id IN ({placeholders})", task_ids).fetchall()
+    conn.close()
+    by_id = {r["id"]: _row_to_task(r) for r in rows}
+    return [by_id[i] for i in task_ids if i in by_id]
+
+
 def get_task(task_id: int) -> Optional[Task]:
     conn = get_conn()
     row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
@@ -165,26 +381,23 @@ def get_task(task_id: int) -> Optional[Task]:
 
 
 def update_task(task: Task):
-    conn = get_conn()
-    conn.execute(
-        """UPDATE tasks SET title=?, description=?, category=?, priority=?,
-           urgency=?, quadrant=?, project_id=?, due_date=?, status=?
-           WHERE id=?""",
-        (
-            task.title,
-            task.description,
-            task.category,
-            task.priority,
-            task.urgency,
-            task.quadrant,
-            task.project_id,
-            task.due_date.isoformat() if task.due_date else None,
-            task.status,
-            task.id,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    update_tasks([task])
+
+
+def update_tasks(tasks: list[Task]) -> int:
+    """여러 태스크를 하나의 트랜잭션으로 수정하고 변경된 행 수를 반환
+
+    반복 태스크를 같은 템플릿의 다른 태스크와 같은 날짜로 옮기면 sqlite3.IntegrityError.
+    """
+    indexes = [_compute_index(t) for t in tasks]
+    updated, entries = 0, []
+    with closing(get_conn()) as conn, conn:
+        for t, index in zip(tasks, indexes):
+            if conn.execute(_UPDATE_TASK, (*_task_params(t), t.id)).rowcount:
+                entries.append((t.id, index))
+                updated += 1
+        _write_index(conn, entries)
+    return updated
 
 
 def delete_task(task_id: int):
@@ -205,3 +418,244 @@ def get_project_progress(project_id: int) -> dict:
     ).fetchone()["c"]
     conn.close()
     return {"total": total, "done": done, "ratio": done / total if total > 0 else 0}
+
+
+def get_task_stats() -> dict:
+    """대시보드 요약 지표를 SQL 집계로 계산"""
+    conn = get_conn()
+    row = conn.execute(
+        """SELECT COUNT(*) AS total,
+                  COALESCE(SUM(status = '완료'), 0) AS done,
+                  COALESCE(SUM(status = '진행중'), 0) AS in_progress,
+                  COALESCE(SUM(due_date < DATE('now', 'localtime') AND status != '완료'), 0) AS overdue
+           FROM tasks"""
+    ).fetchone()
+    by_category = {
+        r["category"]: r["c"]
+        for r in conn.execute("SELECT category, COUNT(*) AS c FROM tasks GROUP BY category")
+    }
+    by_quadrant = {
+        r["quadrant"]: r["c"]
+        for r in conn.execute("SELECT quadrant, COUNT(*) AS c FROM tasks GROUP BY quadrant")
+    }
+    conn.close()
+    return {
+        "total": row["total"],
+        "done": row["done"],
+        "in_progress": row["in_progress"],
+        "overdue": row["overdue"],
+        "by_category": by_category,
+        "by_quadrant": by_quadrant,
+    }
+
+
+# --- 유사(중복) 태스크 탐지 ---
+
+def find_similar_tasks(
+    title: str,
+    description: str = "",
+    threshold: float = 0.5,
+    exclude_id: Optional[int] = None,
+    limit: int = 5,
+) -> list[tuple[Task, float]]:
+    """LSH 버킷이 겹치는 후보만 비교해 유사도가 높은 순으로 반환"""
+    sig = similarity.signature(similarity.task_text(title, description))
+    if sig is None:
+        return []
+    keys = similarity.band_keys(sig)
+    conn = get_conn()
+    candidates = conn.execute(
+        f"""SELECT s.task_id, s.signature FROM task_signatures s
+            WHERE s.task_id IN (
+                SELECT task_id FROM task_lsh
+                WHERE {" OR ".join(["(band = ? AND bucket = ?)"] * len(keys))}
+            )""",
+        [v for pair in enumerate(keys) for v in pair],
+    ).fetchall()
+    scored = []
+    for r in candidates:
+        if r["task_id"] == exclude_id:
+            continue
+        score = similarity.similarity(sig, similarity.unpack(r["signature"]))
+        if score >= threshold:
+            scored.append((r["task_id"], score))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    scored = scored[:limit]
+
+    results = []
+    for task_id, score in scored:
+        row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        results.append((_row_to_task(row), score))
+    conn.close()
+    return results
+
+
+def find_duplicate_groups(threshold: float = 0.7) -> list[list[Task]]:
+    """DB 전체에서 서로 유사한 태스크 묶음을 찾아 큰 묶음부터 반환"""
+    conn = get_conn()
+    sigs = {
+        r["task_id"]: similarity.unpack(r["signature"])
+        for r in conn.execute("SELECT task_id, signature FROM task_signatures")
+    }
+    # 저장된 32밴드 버킷은 입력 중 경고(기준 0.5)용이라 너무 넓음 → 리포트 기준에 맞춘 밴드로 다시 묶음
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for tid, sig in sigs.items():
+        for band, key in enumerate(similarity.band_keys(sig, similarity.REPORT_BANDS)):
+            buckets.setdefault((band, key), []).append(tid)
+
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    # 버킷 안에서는 바로 앞 REPORT_MAX_FANOUT개와만 비교 (거의 같은 태스크가 수천 개인 버킷도 선형).
+    # 이미 같은 묶음이면 비교를 생략하므로 여러 밴드에서 같은 쌍이 다시 나와도 비용이 거의 없음
+    for ids in buckets.values():
+        for i, c in enumerate(ids):
+            root = find(c)
+            for a in ids[max(0, i - similarity.REPORT_MAX_FANOUT):i]:
+                other = find(a)
+                if other != root and similarity.similarity(sigs[a], sigs[c]) >= threshold:
+                    parent[root] = other
+                    root = other
+
+    groups: dict[int, list[int]] = {}
+    for tid in parent:
+        groups.setdefault(find(tid), []).append(tid)
+
+    result = []
+    for ids in groups.values():
+        if len(ids) < 2:
+            continue
+        rows = conn.execute(
+            f"SELECT * FROM tasks WHERE id IN ({','.join('?' * len(ids))}) ORDER BY created_at",
+            ids,
+        ).fetchall()
+        result.append([_row_to_task(r) for r in rows])
+    conn.close()
+    result.sort(key=len, reverse=True)
+    return result
+
+
+# --- 반복 태스크 템플릿 ---
+
+RECURRENCE_HORIZON_DAYS = 60
+
+
+def _row_to_template(r) -> RecurringTemplate:
+    until = r["materialized_until"]
+    return RecurringTemplate(
+        id=r["id"],
+        title=r["title"],
+        description=r["description"],
+        category=r["category"],
+        priority=r["priority"],
+        urgency=r["urgency"],
+        project_id=r["project_id"],
+        rrule=r["rrule"],
+        start_date=date.fromisoformat(r["start_date"]),
+        materialized_until=date.fromisoformat(until) if until else None,
+        active=bool(r["active"]),
+        created_at=r["created_at"],
+    )
+
+
+def add_template(template: RecurringTemplate) -> int:
+    recurrence.parse_rule(template.rrule)  # 잘못된 규칙은 저장 전에 ValueError
+    # 이전 버전 DB의 recurring_templates에는 CHECK 제약이 없으므로 여기서도 검사
+    if template.priority not in PRIORITIES or template.urgency not in URGENCIES:
+        raise ValueError(f"잘못된 중요도/긴급도: {template.priority}/{template.urgency}")
+    conn = get_conn()
+    cur = conn.execute(
+        """INSERT INTO recurring_templates (title, description, category, priority,
+           urgency, project_id, rrule, start_date, active)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            template.title,
+            template.description,
+            template.category,
+            template.priority,
+            template.urgency,
+            template.project_id,
+            template.rrule,
+            (template.start_date or date.today()).isoformat(),
+            int(template.active),
+        ),
+    )
+    conn.commit()
+    tid = cur.lastrowid
+    conn.close()
+    return tid
+
+
+def get_templates() -> list[RecurringTemplate]:
+    conn = get_conn()
+    rows = conn.execute("SELECT * FROM recurring_templates ORDER BY created_at DESC").fetchall()
+    conn.close()
+    return [_row_to_template(r) for r in rows]
+
+
+def delete_template(template_id: int):
+    """템플릿과 아직 시작하지 않은 앞으로의 반복 태스크를 삭제 (지난 태스크는 유지)"""
+    conn = get_conn()
+    conn.execute(
+        "DELETE FROM tasks WHERE template_id = ? AND status = '진행전' AND due_date >= ?",
+        (template_id, date.today().isoformat()),
+    )
+    conn.execute("DELETE FROM recurring_templates WHERE id = ?", (template_id,))
+    conn.commit()
+    conn.close()
+
+
+def materialize_recurring_tasks(
+    horizon_days: int = RECURRENCE_HORIZON_DAYS,
+    today: Optional[date] = None,
+    template_ids: Optional[list[int]] = None,
+) -> int:
+    """활성 템플릿의 반복 태스크를 오늘부터 horizon_days 이후까지 일괄 생성
+
+    템플릿마다 materialized_until 이후 구간만 새로 계산하고, (template_id, due_date)
+    유니크 충돌만 무시하므로 여러 번 호출해도 안전합니다.
+    생성된 태스크 수를 반환합니다.
+    """
+    today = today or date.today()
+    horizon = today + timedelta(days=horizon_days)
+    conn = get_conn()
+    query = """SELECT * FROM recurring_templates
+               WHERE active = 1 AND (materialized_until IS NULL OR materialized_until < ?)"""
+    params: list = [horizon.isoformat()]
+    if template_ids is not None:
+        query += f" AND id IN ({','.join('?' * len(template_ids))})"
+        params.extend(template_ids)
+    templates = [_row_to_template(r) for r in conn.execute(query, params)]
+
+    rows, marks = [], []
+    for t in templates:
+        # 검증 이전에 저장된 잘못된 템플릿(값·규칙)은 건너뛰고 materialized_until도 유지
+        if t.priority not in PRIORITIES or t.urgency not in URGENCIES:
+            continue
+        try:
+            rule = recurrence.parse_rule(t.rrule)
+        except ValueError:
+            continue
+        # 지난 날짜는 만들지 않음 (오래된 시작일로 밀린 태스크가 쌓이지 않도록)
+        after = max(t.materialized_until or date.min, today - timedelta(days=1))
+        for due in recurrence.occurrences(rule, t.start_date, after, horizon):
+            rows.append((
+                t.title, t.description, t.category, t.priority, t.urgency,
+                t.project_id, due.isoformat(), "진행전", t.id,
+            ))
+        marks.append((horizon.isoformat(), t.id))
+
+    # OR IGNORE는 CHECK 위반까지 삼키므로 멱등성용 유니크 충돌만 무시
+    insert = _INSERT_TASK + """
+           ON CONFLICT (template_id, due_date) WHERE template_id IS NOT NULL DO NOTHING"""
+    with conn:
+        created = conn.executemany(insert, rows).rowcount
+        conn.executemany("UPDATE recurring_templates SET materialized_until = ? WHERE id = ?", marks)
+    conn.close()
+    return max(created, 0)
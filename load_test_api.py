@@ -0,0 +1,166 @@
+"""api.py 로컬 부하 테스트
+
+사용법 (api.py 실행 중일 때):
+    python load_test_api.py --clients 20 --requests 200
+    python load_test_api.py --mix list      → 목록 조회만
+    python load_test_api.py --mix write     → 일괄 추가/수정만
+
+⚠️ 쓰기 요청은 실제 DB에 태스크를 추가합니다. 테스트용 DB로 실행하세요.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+
+class Client:
+    """keep-alive 연결 하나로 요청을 반복하는 최소 HTTP/1.1 클라이언트"""
+
+    def __init__(self, host: str, port: int, token: str):
+        self.host, self.port, self.token = host, port, token
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload=None) -> tuple[int, bytes]:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Authorization: Bearer {self.token}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding") == "chunked":
+            data = b""
+            while (size := int((await self.reader.readline()).strip(), 16)) > 0:
+                data += await self.reader.readexactly(size)
+                await self.reader.readline()
+            await self.reader.readline()
+            return status, data
+        return status, await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def _random_task(i: int) -> dict:
+    return {
+        "title": f"부하 테스트 태스크 {i}",
+        "category": random.choice(["업무", "개인"]),
+        "priority": random.choice(["높음", "중간", "낮음"]),
+        "urgency": random.choice(["긴급", "보통", "여유"]),
+    }
+
+
+async def _create(client: Client, created: list) -> int:
+    status, body = await client.request("POST", "/tasks", [_random_task(i) for i in range(20)])
+    if status == 201:
+        created.extend(json.loads(body)["ids"])
+    return status
+
+
+async def _update(client: Client, created: list) -> int:
+    """이 연결이 만든 태스크 중 일부의 상태·중요도만 일괄 수정 (아직 없으면 먼저 추가)"""
+    if not created:
+        await _create(client, created)
+    patches = [
+        {"id": task_id, "status": random.choice(["진행전", "진행중", "완료"]),
+         "priority": random.choice(["높음", "중간", "낮음"])}
+        for task_id in random.sample(created, min(20, len(created)))
+    ]
+    status, _ = await client.request("PATCH", "/tasks", patches)
+    return status
+
+
+async def _get(client: Client, path: str) -> int:
+    status, _ = await client.request("GET", path)
+    return status
+
+
+OPERATIONS = {
+    "list": lambda c, created: _get(c, "/tasks?limit=50&order_by=" + random.choice(
+        ["due_date", "priority", "quadrant", "created_at"])),
+    "stream": lambda c, created: _get(c, "/tasks?format=ndjson"),
+    "stats": lambda c, created: _get(c, "/stats"),
+    "create": _create,
+    "update": _update,
+}
+
+MIXES = {
+    "default": {"list": 55, "stats": 20, "create": 10, "update": 10, "stream": 5},
+    "list": {"list": 80, "stream": 20},
+    "write": {"create": 50, "update": 50},
+}
+
+
+async def _worker(args, results: list, latencies: dict):
+    client = Client(args.host, args.port, args.token)
+    await client.connect()
+    mix = MIXES[args.mix]
+    names, weights = list(mix), list(mix.values())
+    created: list[int] = []
+    try:
+        for _ in range(args.requests):
+            op = random.choices(names, weights)[0]
+            start = time.perf_counter()
+            status = await OPERATIONS[op](client, created)
+            latencies.setdefault(op, []).append(time.perf_counter() - start)
+            results.append(status)
+    finally:
+        await client.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(args):
+    results: list[int] = []
+    latencies: dict[str, list[float]] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(args, results, latencies) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    errors = sum(1 for s in results if s >= 400)
+    print(f"요청 {len(results)}건 / {elapsed:.2f}s → {len(results) / elapsed:.1f} req/s (오류 {errors}건)")
+    for op, values in sorted(latencies.items()):
+        print(
+            f"  {op:<7} n={len(values):<6} "
+            f"p50={_percentile(values, 50) * 1000:.1f}ms "
+            f"p95={_percentile(values, 95) * 1000:.1f}ms "
+            f"p99={_percentile(values, 99) * 1000:.1f}ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="태스크 API 부하 테스트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--clients", type=int, default=10, help="동시 연결 수")
+    parser.add_argument("--requests", type=int, default=100, help="연결당 요청 수")
+    parser.add_argument("--mix", choices=list(MIXES), default="default")
+    parser.add_argument("--token", default=os.getenv("APP_PASSWORD", "admin1234"))
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+"""Streamlit 앱 동시 세션 부하 테스트 (실제 `streamlit run` 서버 + 웹소켓 클라이언트)
+
+합성 DB를 임시 폴더에 만들고 그 DB를 쓰는 Streamlit 서버 프로세스 하나를 띄운 뒤,
+브라우저 대신 웹소켓 클라이언트 N개가 동시에 로그인해 필터 변경·정렬·태스크 저장·
+태스크 추가·새로고침(탭 전환)을 섞어 실행하며 rerun 지연 시간을 측정합니다.
+모든 세션이 서버 프로세스 하나(같은 GIL, 같은 st.cache_*, 같은 SQLite 파일)를 공유하므로
+`streamlit run app.py` 한 개가 감당하는 동시 사용자 수를 가늠하는 데 씁니다.
+classify_task는 서버 프로세스 안에서 네트워크 없이 즉시 응답하는 가짜 함수로 대체합니다.
+
+사용법:
+    python load_test_app.py --sessions 10 --actions 20
+    python load_test_app.py --sessions 20 --tasks 2000 --mix write --seed 7
+
+참고:
+- 클라이언트는 Streamlit 프런트엔드와 같은 protobuf 메시지(BackMsg/ForwardMsg)를
+  /_stcore/stream 웹소켓으로 주고받습니다. 위젯 값 형식은 설치된 streamlit 버전을 따릅니다.
+- 지연 시간은 rerun 요청을 보낸 뒤 script_finished를 받을 때까지이며,
+  st.rerun()으로 이어진 재실행과 화면 변경분 전송 시간이 포함됩니다.
+- 탭 전환은 브라우저에서만 일어나고 서버 rerun을 만들지 않으므로,
+  'tab' 동작은 위젯 변경 없는 rerun(새로고침)으로 흉내냅니다.
+- 클라이언트도 같은 머신에서 돌기 때문에 코어가 적으면 서버와 CPU를 나눠 씁니다.
+"""
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import date, timedelta
+from typing import Optional
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+import ai_classifier
+import database
+from models import Task, STATUSES
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+SLOW_WRITE_SECONDS = 0.05
+SERVER_START_TIMEOUT = 30
+# 로그인(세션 준비)은 측정 대상이 아니므로 동시 접속이 몰려도 기다릴 수 있게 넉넉히
+LOGIN_TIMEOUT = 300
+
+MIXES = {
+    "default": {"filter": 45, "sort": 15, "save": 20, "add": 5, "tab": 15},
+    "read": {"filter": 60, "sort": 20, "tab": 20},
+    "write": {"save": 70, "add": 30},
+}
+
+
+# --- DB 쓰기 잠금 측정 (서버 프로세스 안에서 기록) ---
+
+class WriteStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations: list[float] = []
+        self.locked_errors = 0
+
+    def record(self, seconds: float):
+        with self.lock:
+            self.durations.append(seconds)
+
+    def record_locked(self):
+        with self.lock:
+            self.locked_errors += 1
+
+
+write_stats = WriteStats()
+
+
+class TimedConnection(sqlite3.Connection):
+    """쓰기 문장과 commit에 걸린 시간을 기록 (잠금 대기 시간이 여기에 포함됨)"""
+
+    def _timed(self, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        except sqlite3.OperationalError as e:
+            if "locked" in str(e):
+                write_stats.record_locked()
+            raise
+        finally:
+            write_stats.record(time.perf_counter() - start)
+
+    def execute(self, sql, *args):
+        if sql.lstrip()[:6].upper() in ("INSERT", "UPDATE", "DELETE"):
+            return self._timed(super().execute, sql, *args)
+        return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self._timed(super().executemany, sql, *args)
+
+    def commit(self):
+        return self._timed(super().commit)
+
+    def __exit__(self, *exc):
+        # `with conn:`의 commit/rollback은 commit()을 거치지 않으므로 따로 측정
+        return self._timed(super().__exit__, *exc)
+
+
+def _timed_get_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(database.DB_PATH, factory=TimedConnection)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def _stub_classify(title: str, description: str = "") -> dict:
+    rnd = random.Random(title)
+    return {
+        "category": rnd.choice(["업무", "개인"]),
+        "priority": rnd.choice(["높음", "중간", "낮음"]),
+        "urgency": rnd.choice(["긴급", "보통", "여유"]),
+    }
+
+
+def build_synthetic_db(path: str, num_tasks: int, num_projects: int, seed: int):
+    database.DB_PATH = path
+    database.init_db()
+    rnd = random.Random(seed)
+    project_ids = [database.add_project(f"프로젝트 {i}", "부하 테스트용") for i in range(num_projects)]
+    words = ["보고서", "회의", "장보기", "운동", "발표", "고객", "예산", "계획", "리뷰", "정리", "메일", "전화"]
+    tasks = []
+    for i in range(num_tasks):
+        cls = _stub_classify(f"{i}")
+        tasks.append(Task(
+            title=" ".join(rnd.sample(words, 3)) + f" #{i}",
+            category=cls["category"],
+            priority=cls["priority"],
+            urgency=cls["urgency"],
+            project_id=rnd.choice(project_ids + [None]),
+            due_date=date.today() + timedelta(days=rnd.randint(-10, 60)) if rnd.random() < 0.8 else None,
+            status=rnd.choice(STATUSES),
+        ))
+    database.add_tasks(tasks)
+
+
+# --- 서버 프로세스 ---
+
+def _dump_write_stats(path: str):
+    with open(path, "w") as f:
+        json.dump({"durations": write_stats.durations, "locked": write_stats.locked_errors}, f)
+
+
+def serve(db_path: str, port: int, stats_path: str):
+    """합성 DB·가짜 분류기·쓰기 측정을 적용한 채 이 프로세스에서 `streamlit run app.py` 실행"""
+    database.DB_PATH = db_path
+    database.get_conn = _timed_get_conn
+    ai_classifier.classify_task = _stub_classify
+    # 종료 신호(SIGTERM)로 서버가 멈추면 쓰기 측정값을 파일로 넘김
+    atexit.register(_dump_write_stats, stats_path)
+
+    from streamlit.web import cli as stcli
+    sys.argv = [
+        "streamlit", "run", APP_PATH,
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+        "--logger.level", "error",
+    ]
+    stcli.main()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_healthy(port: int, proc: subprocess.Popen):
+    deadline = time.time() + SERVER_START_TIMEOUT
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("Streamlit 서버가 시작 중에 종료됨")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Streamlit 서버가 {SERVER_START_TIMEOUT}초 안에 뜨지 않음")
+
+
+# --- 웹소켓 세션 ---
+
+class Session:
+    """브라우저 탭 하나처럼 웹소켓으로 rerun을 요청하는 최소 Streamlit 클라이언트"""
+
+    def __init__(self, url: str, timeout: float):
+        self.url, self.timeout = url, timeout
+        self.ws = None
+        self.widgets: list[tuple[str, object]] = []  # 마지막 실행 화면의 (위젯 종류, proto)
+        self.values: dict[str, WidgetState] = {}  # 프런트엔드처럼 매 rerun에 다시 보내는 위젯 값
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def find(self, kind: str, label: Optional[str] = None, key: Optional[str] = None,
+             form: Optional[str] = None) -> list:
+        """key는 앞부분만 맞아도 됨 (예: 'save_' → 모든 저장 버튼)"""
+        return [
+            w for k, w in self.widgets
+            if k == kind
+            and (label is None or w.label == label)
+            and (key is None or w.id.rsplit("-", 1)[-1].startswith(key))
+            and (form is None or w.form_id == form)
+        ]
+
+    async def rerun(self, changes: list[WidgetState] = (), trigger: Optional[WidgetState] = None,
+                    timeout: Optional[float] = None) -> list[str]:
+        """rerun을 요청하고 마지막 script_finished까지 기다림. 스크립트 예외 메시지 목록을 반환"""
+        for state in changes:
+            self.values[state.id] = state
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self.values.values())
+        if trigger is not None:
+            msg.rerun_script.widget_states.widgets.append(trigger)
+        await self.ws.send(msg.SerializeToString())
+        return await asyncio.wait_for(self._read_run(), timeout or self.timeout)
+
+    async def _read_run(self) -> list[str]:
+        errors = []
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.widgets, errors = [], []
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                name = element.WhichOneof("type")
+                proto = getattr(element, name)
+                if name == "exception":
+                    errors.append(f"{proto.type}: {proto.message}")
+                elif getattr(proto, "id", ""):
+                    self.widgets.append((name, proto))
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue  # st.rerun() → 이어지는 실행까지 기다림
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    errors.append("스크립트 컴파일 오류")
+                return errors
+
+
+def _string(widget, value: str) -> WidgetState:
+    return WidgetState(id=widget.id, string_value=value)
+
+
+def _trigger(widget) -> WidgetState:
+    return WidgetState(id=widget.id, trigger_value=True)
+
+
+async def _open_session(url: str, args) -> Session:
+    """새 세션을 열고 로그인 폼으로 로그인"""
+    session = Session(url, args.timeout)
+    await session.connect()
+    await session.rerun(timeout=LOGIN_TIMEOUT)
+    password = session.find("text_input", "비밀번호", form="login_form")
+    submit = session.find("button", "로그인", form="login_form")
+    if not password or not submit:
+        raise RuntimeError("로그인 화면을 찾지 못함")
+    await session.rerun([_string(password[0], args.password)], _trigger(submit[0]), timeout=LOGIN_TIMEOUT)
+    if not session.find("selectbox", "정렬"):
+        raise RuntimeError("로그인 실패 (APP_PASSWORD 확인)")
+    return session
+
+
+# --- 세션 동작 (보낼 위젯 값과 누를 버튼을 반환) ---
+
+def act_filter(s: Session, rnd: random.Random):
+    radio = s.find("radio", rnd.choice(["카테고리", "상태"]))[0]
+    return [_string(radio, rnd.choice(list(radio.options)))], None
+
+
+def act_sort(s: Session, rnd: random.Random):
+    select = s.find("selectbox", "정렬")[0]
+    return [_string(select, rnd.choice(list(select.options)))], None
+
+
+def act_save(s: Session, rnd: random.Random):
+    buttons = s.find("button", key="save_")
+    if not buttons:
+        return [], None
+    button = rnd.choice(buttons)
+    tid = button.id.rsplit("_", 1)[1]
+    status = s.find("selectbox", key=f"status_{tid}")[0]
+    return [_string(status, rnd.choice(STATUSES))], _trigger(button)
+
+
+def act_add(s: Session, rnd: random.Random):
+    title = s.find("text_input", "제목 *", form="add_task_form")[0]
+    allow = s.find("checkbox", "유사 태스크가 있어도 추가", form="add_task_form")[0]
+    submit = s.find("button", "추가", form="add_task_form")[0]
+    return [
+        _string(title, f"부하 테스트 추가 {rnd.randrange(10 ** 9)}"),
+        WidgetState(id=allow.id, bool_value=True),
+    ], _trigger(submit)
+
+
+def act_tab(s: Session, rnd: random.Random):
+    return [], None
+
+
+ACTIONS = {"filter": act_filter, "sort": act_sort, "save": act_save, "add": act_add, "tab": act_tab}
+
+
+async def run_session(index: int, args, url: str, barrier: asyncio.Barrier) -> dict:
+    result = {"latencies": {}, "failures": {}, "errors": [], "rebuilds": 0, "start": None, "end": None}
+    rnd = random.Random(args.seed * 1000 + index)
+    names, weights = list(MIXES[args.mix]), list(MIXES[args.mix].values())
+    session = None
+    try:
+        session = await _open_session(url, args)
+        # 모든 세션이 로그인을 마친 뒤 동시에 시작
+        await barrier.wait()
+        result["start"] = time.time()
+        for _ in range(args.actions):
+            name = rnd.choices(names, weights)[0]
+            changes, trigger = ACTIONS[name](session, rnd)
+            start = time.perf_counter()
+            try:
+                errors = await session.rerun(changes, trigger)
+                failed = "; ".join(errors)
+            except Exception as e:
+                failed = f"{type(e).__name__}: {e}"
+            # 실패한 rerun도 지연 시간에 포함 (타임아웃 등이 통계에서 빠지지 않도록)
+            result["latencies"].setdefault(name, []).append(time.perf_counter() - start)
+            if failed:
+                result["failures"][name] = result["failures"].get(name, 0) + 1
+                result["errors"].append(f"세션 {index} {name}: {failed}")
+                # 실패한 세션은 서버 쪽 상태가 꼬였을 수 있으므로 새 세션으로 다시 로그인
+                await session.close()
+                session = await _open_session(url, args)
+                result["rebuilds"] += 1
+            if args.think > 0:
+                await asyncio.sleep(rnd.uniform(0, args.think))
+        result["end"] = time.time()
+    except Exception as e:
+        # 시작 전에 실패하면 barrier를 깨서 다른 세션이 무한히 기다리지 않게 함
+        await barrier.abort()
+        result["errors"].append(f"세션 {index} 중단: {type(e).__name__}: {e}")
+    finally:
+        if session is not None:
+            await session.close()
+    return result
+
+
+async def run_sessions(args, url: str) -> list[dict]:
+    barrier = asyncio.Barrier(args.sessions)
+    return await asyncio.gather(*(run_session(i, args, url, barrier) for i in range(args.sessions)))
+
+
+# --- 결과 ---
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _fmt(values: list[float]) -> str:
+    return (
+        f"p50={_percentile(values, 50) * 1000:.0f}ms "
+        f"p95={_percentile(values, 95) * 1000:.0f}ms "
+        f"p99={_percentile(values, 99) * 1000:.0f}ms "
+        f"max={max(values) * 1000:.0f}ms"
+    )
+
+
+def report(args, results: list[dict], writes: list[float], locked: int):
+    latencies: dict[str, list[float]] = {}
+    failures: dict[str, int] = {}
+    errors = []
+    rebuilds = 0
+    for r in results:
+        errors.extend(r["errors"])
+        rebuilds += r["rebuilds"]
+        for name, values in r["latencies"].items():
+            latencies.setdefault(name, []).extend(values)
+        for name, count in r["failures"].items():
+            failures[name] = failures.get(name, 0) + count
+    all_latencies = [v for values in latencies.values() for v in values]
+    windows = [r for r in results if r["start"] is not None and r["end"] is not None]
+    elapsed = max(r["end"] for r in windows) - min(r["start"] for r in windows) if windows else 0
+
+    print(f"서버 1개, 세션 {args.sessions}개 × 동작 {args.actions}개, 태스크 {args.tasks}개 ({args.mix})")
+    if all_latencies and elapsed > 0:
+        print(f"rerun {len(all_latencies)}회 / {elapsed:.2f}s → {len(all_latencies) / elapsed:.1f} rerun/s")
+        print(f"  전체    n={len(all_latencies):<5} 실패={sum(failures.values()):<3} {_fmt(all_latencies)}")
+        for name, values in sorted(latencies.items()):
+            print(f"  {name:<7} n={len(values):<5} 실패={failures.get(name, 0):<3} {_fmt(values)}")
+
+    if writes:
+        slow = sum(1 for w in writes if w >= SLOW_WRITE_SECONDS)
+        print(
+            f"DB 쓰기 {len(writes)}회: {_fmt(writes)}, "
+            f"{SLOW_WRITE_SECONDS * 1000:.0f}ms 이상 {slow}회, 'database is locked' {locked}회"
+        )
+    if errors:
+        print(f"오류 {len(errors)}건, 세션 재생성 {rebuilds}회 (최대 10건 표시):")
+        for e in errors[:10]:
+            print(f"  - {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit 앱 동시 세션 부하 테스트")
+    parser.add_argument("--sessions", type=int, default=5, help="동시 세션(웹소켓 연결) 수")
+    parser.add_argument("--actions", type=int, default=20, help="세션당 동작 수")
+    parser.add_argument("--tasks", type=int, default=300, help="합성 DB 태스크 수")
+    parser.add_argument("--projects", type=int, default=10, help="합성 DB 프로젝트 수")
+    parser.add_argument("--mix", choices=list(MIXES), default="default")
+    parser.add_argument("--think", type=float, default=0.0, help="동작 사이 최대 대기 시간(초)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="rerun 하나의 제한 시간(초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default=os.getenv("APP_PASSWORD", "admin1234"))
+    # 내부용: 부하 테스트가 띄우는 서버 프로세스
+    parser.add_argument("--serve", metavar="DB_PATH", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--stats", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.stats)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "tasks.db")
+        stats_path = os.path.join(tmp, "writes.json")
+        build_synthetic_db(db_path, args.tasks, args.projects, args.seed)
+
+        port = _free_port()
+        with open(os.path.join(tmp, "server.log"), "w") as log:
+            server = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__),
+                 "--serve", db_path, "--port", str(port), "--stats", stats_path],
+                cwd=tmp, env=dict(os.environ, APP_PASSWORD=args.password),
+                stdout=log, stderr=subprocess.STDOUT,
+            )
+        try:
+            _wait_until_healthy(port, server)
+            results = asyncio.run(run_sessions(args, f"ws://127.0.0.1:{port}/_stcore/stream"))
+        except Exception:
+            with open(os.path.join(tmp, "server.log")) as f:
+                print(f.read()[-2000:], file=sys.stderr)
+            raise
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        stats = {"durations": [], "locked": 0}
+        if os.path.exists(stats_path):
+            with open(stats_path) as f:
+                stats = json.load(f)
+
+    report(args, results, stats["durations"], stats["locked"])
+
+
+if __name__ == "__main__":
+    main()
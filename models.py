@@ -2,6 +2,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import Optional
 
+CATEGORIES = ("업무", "개인")
+PRIORITIES = ("높음", "중간", "낮음")
+URGENCIES = ("긴급", "보통", "여유")
+STATUSES = ("진행전", "진행중", "완료")
+
 
 @dataclass
 class Task:
@@ -11,11 +16,12 @@ class Task:
     category: str = "업무"  # 업무 / 개인
     priority: str = "중간"  # 높음 / 중간 / 낮음
     urgency: str = "보통"  # 긴급 / 보통 / 여유
-    quadrant: int = 4  # 아이젠하워 사분면 1~4
+    quadrant: int = 4  # 아이젠하워 사분면 1~4 (DB 생성 컬럼, 저장 시 중요도·긴급도로 계산됨)
     project_id: Optional[int] = None
     due_date: Optional[date] = None
     status: str = "진행전"  # 진행전 / 진행중 / 완료
     created_at: Optional[datetime] = None
+    template_id: Optional[int] = None  # 반복 템플릿에서 생성된 경우
 
     @property
     def quadrant_label(self) -> str:
@@ -40,3 +46,19 @@ class Project:
     name: str = ""
     description: str = ""
     created_at: Optional[datetime] = None
+
+
+@dataclass
+class RecurringTemplate:
+    id: Optional[int] = None
+    title: str = ""
+    description: str = ""
+    category: str = "업무"
+    priority: str = "중간"
+    urgency: str = "보통"  # 분류 결과는 템플릿 생성 시 한 번만 구해 저장
+    project_id: Optional[int] = None
+    rrule: str = "FREQ=WEEKLY"  # recurrence.py 규칙 문자열
+    start_date: Optional[date] = None
+    materialized_until: Optional[date] = None  # 이 날짜까지 태스크 생성 완료
+    active: bool = True
+    created_at: Optional[datetime] = None
@@ -0,0 +1,157 @@
+"""반복 태스크 일정 규칙 (RFC 5545 RRULE의 단순화된 부분집합)
+
+지원 형식 예:
+    FREQ=DAILY;INTERVAL=2
+    FREQ=WEEKLY;BYDAY=MO,TH
+    FREQ=MONTHLY;BYMONTHDAY=1,-1      (-1 = 말일)
+    FREQ=YEARLY;UNTIL=2027-12-31
+    FREQ=WEEKLY;COUNT=10
+"""
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+WEEKDAY_LABELS = ("월", "화", "수", "목", "금", "토", "일")
+
+
+@dataclass
+class Rule:
+    freq: str = "WEEKLY"
+    interval: int = 1
+    byday: tuple[int, ...] = ()  # 0=월요일 ~ 6=일요일 (WEEKLY 전용)
+    bymonthday: tuple[int, ...] = ()  # 1~31, 음수는 말일 기준 (MONTHLY 전용)
+    until: Optional[date] = None
+    count: Optional[int] = None
+
+
+def parse_rule(text: str) -> Rule:
+    """규칙 문자열을 Rule로 변환. 잘못된 형식이면 ValueError"""
+    rule = Rule()
+    seen_freq = False
+    for part in filter(None, (p.strip() for p in text.upper().split(";"))):
+        key, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"잘못된 규칙 항목: {part}")
+        if key == "FREQ":
+            if value not in FREQUENCIES:
+                raise ValueError(f"지원하지 않는 FREQ: {value}")
+            rule.freq = value
+            seen_freq = True
+        elif key == "INTERVAL":
+            rule.interval = int(value)
+            if rule.interval < 1:
+                raise ValueError("INTERVAL은 1 이상이어야 합니다.")
+        elif key == "BYDAY":
+            try:
+                rule.byday = tuple(sorted({WEEKDAYS.index(d) for d in value.split(",")}))
+            except ValueError:
+                raise ValueError(f"잘못된 BYDAY: {value}")
+        elif key == "BYMONTHDAY":
+            days = tuple(sorted({int(d) for d in value.split(",")}))
+            if any(d == 0 or not -31 <= d <= 31 for d in days):
+                raise ValueError(f"잘못된 BYMONTHDAY: {value}")
+            rule.bymonthday = days
+        elif key == "UNTIL":
+            rule.until = date.fromisoformat(value if "-" in value else f"{value[:4]}-{value[4:6]}-{value[6:8]}")
+        elif key == "COUNT":
+            rule.count = int(value)
+            if rule.count < 1:
+                raise ValueError("COUNT는 1 이상이어야 합니다.")
+        else:
+            raise ValueError(f"지원하지 않는 규칙 항목: {key}")
+    if not seen_freq:
+        raise ValueError("FREQ는 필수입니다.")
+    # 다른 FREQ에 붙은 BY* 항목은 전개 시 무시되므로 조용히 다른 일정이 되지 않도록 거부
+    if rule.byday and rule.freq != "WEEKLY":
+        raise ValueError("BYDAY는 FREQ=WEEKLY에서만 지원합니다.")
+    if rule.bymonthday and rule.freq != "MONTHLY":
+        raise ValueError("BYMONTHDAY는 FREQ=MONTHLY에서만 지원합니다.")
+    return rule
+
+
+def describe(rule: Rule, start: date) -> str:
+    """화면 표시용 한국어 설명 (예: '2주마다 월·목')"""
+    unit = {"DAILY": "일", "WEEKLY": "주", "MONTHLY": "개월", "YEARLY": "년"}[rule.freq]
+    head = f"{rule.interval}{unit}마다" if rule.interval > 1 else {
+        "DAILY": "매일", "WEEKLY": "매주", "MONTHLY": "매월", "YEARLY": "매년",
+    }[rule.freq]
+    if rule.freq == "WEEKLY":
+        head += " " + "·".join(WEEKDAY_LABELS[d] for d in (rule.byday or (start.weekday(),)))
+    elif rule.freq == "MONTHLY":
+        head += " " + ", ".join(
+            "말일" if d == -1 else f"말일-{-d - 1}" if d < 0 else f"{d}일"
+            for d in (rule.bymonthday or (start.day,))
+        )
+    elif rule.freq == "YEARLY":
+        head += f" {start.month}월 {start.day}일"
+    if rule.until:
+        head += f" ({rule.until.isoformat()}까지)"
+    if rule.count:
+        head += f" ({rule.count}회)"
+    return head
+
+
+def _add_months(year: int, month: int, months: int) -> tuple[int, int]:
+    idx = year * 12 + (month - 1) + months
+    return idx // 12, idx % 12 + 1
+
+
+def _period_dates(rule: Rule, start: date, k: int) -> tuple[date, list[date]]:
+    """start부터 k번째 반복 주기의 시작일과 그 주기에 속한 날짜들 (정렬됨)"""
+    step = k * rule.interval
+    if rule.freq == "DAILY":
+        day = start + timedelta(days=step)
+        return day, [day]
+    if rule.freq == "WEEKLY":
+        week_start = start - timedelta(days=start.weekday()) + timedelta(weeks=step)
+        return week_start, [week_start + timedelta(days=d) for d in (rule.byday or (start.weekday(),))]
+    if rule.freq == "MONTHLY":
+        year, month = _add_months(start.year, start.month, step)
+        last = calendar.monthrange(year, month)[1]
+        days = sorted({d if d > 0 else last + d + 1 for d in (rule.bymonthday or (start.day,))})
+        # 해당 월에 없는 날짜(예: 2월 30일)는 건너뜀
+        return date(year, month, 1), [date(year, month, d) for d in days if 1 <= d <= last]
+    year = start.year + step
+    if start.month == 2 and start.day == 29 and not calendar.isleap(year):
+        return date(year, 1, 1), []
+    return date(year, 1, 1), [date(year, start.month, start.day)]
+
+
+def _first_period(rule: Rule, start: date, after: date) -> int:
+    """after 직전 주기부터 시작해 앞쪽 주기 순회를 건너뜀 (COUNT가 없을 때만)"""
+    if rule.count or after < start:
+        return 0
+    if rule.freq == "DAILY":
+        periods = (after - start).days
+    elif rule.freq == "WEEKLY":
+        periods = (after - start).days // 7
+    elif rule.freq == "MONTHLY":
+        periods = (after.year - start.year) * 12 + after.month - start.month
+    else:
+        periods = after.year - start.year
+    return max(0, periods // rule.interval - 1)
+
+
+def occurrences(rule: Rule, start: date, after: date, until: date) -> list[date]:
+    """start를 기준으로 한 반복 날짜 중 after < 날짜 <= until 인 것"""
+    end = min(until, rule.until) if rule.until else until
+    result = []
+    emitted = 0
+    k = _first_period(rule, start, after)
+    while True:
+        period_start, dates = _period_dates(rule, start, k)
+        if period_start > end:
+            break
+        for d in dates:
+            if d < start or d > end:
+                continue
+            emitted += 1
+            if rule.count and emitted > rule.count:
+                return result
+            if d > after:
+                result.append(d)
+        k += 1
+    return result
@@ -0,0 +1,86 @@
+"""문자 n-gram MinHash/LSH 기반 유사 태스크 탐지
+
+띄어쓰기와 조사가 제각각인 한국어 제목도 문자 단위 n-gram으로 비교하면
+"주간 보고서 작성" / "주간보고서 작성하기" 같은 변형을 잘 잡아냅니다.
+시그니처와 LSH 버킷은 database.py가 tasks.db에 함께 저장합니다.
+"""
+import random
+import re
+import zlib
+from array import array
+from operator import eq
+from typing import Optional
+
+NGRAM = 2
+NUM_PERM = 64
+# 밴드 32개 × 2행 → 후보가 되는 유사도 기준 ≈ (1/32)^(1/2) ≈ 0.18.
+# 경고 기준(0.5)보다 충분히 낮아 유사도 0.5인 쌍도 99.99% 확률로 후보에 오름
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+# 전체 DB 중복 리포트(기준 0.7)는 같은 시그니처를 16밴드 × 4행으로 다시 묶어 후보를 줄임.
+# 후보 기준 ≈ (1/16)^(1/4) = 0.5, 유사도 0.7인 쌍이 후보에 오를 확률 ≈ 98.8%
+REPORT_BANDS = 16
+# 리포트에서 한 버킷 안의 태스크가 비교하는 앞선 태스크 수 상한 (버킷이 커도 비교 횟수가 선형)
+REPORT_MAX_FANOUT = 64
+
+_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+# 프로세스가 달라도 같은 시그니처가 나오도록 고정 시드 사용
+_rng = random.Random(20240101)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+]
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    return _NON_WORD.sub("", text.lower())
+
+
+def shingles(text: str) -> set[int]:
+    norm = normalize(text)
+    if len(norm) < NGRAM:
+        return {zlib.crc32(norm.encode("utf-8"))} if norm else set()
+    return {
+        zlib.crc32(norm[i:i + NGRAM].encode("utf-8"))
+        for i in range(len(norm) - NGRAM + 1)
+    }
+
+
+def task_text(title: str, description: str = "") -> str:
+    return f"{title} {description or ''}"
+
+
+def signature(text: str) -> Optional[list[int]]:
+    """MinHash 시그니처 (NUM_PERM개의 32비트 정수). 비교할 글자가 없으면 None
+
+    이모지·문장부호만 있는 제목에 상수 시그니처를 주면 서로 100% 일치하므로 색인하지 않음.
+    """
+    sh = shingles(text)
+    if not sh:
+        return None
+    return [min(((a * x + b) % _PRIME) & MAX_HASH for x in sh) for a, b in _PERMUTATIONS]
+
+
+def band_keys(sig: list[int], bands: int = BANDS) -> list[int]:
+    """밴드별 버킷 키. 한 밴드라도 같으면 후보로 취급"""
+    rows = NUM_PERM // bands
+    return [
+        zlib.crc32(array("I", sig[b * rows:(b + 1) * rows]).tobytes())
+        for b in range(bands)
+    ]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """두 시그니처로 추정한 Jaccard 유사도 (0~1)"""
+    return sum(map(eq, sig_a, sig_b)) / NUM_PERM
+
+
+def pack(sig: list[int]) -> bytes:
+    return array("I", sig).tobytes()
+
+
+def unpack(blob: bytes) -> list[int]:
+    sig = array("I")
+    sig.frombytes(blob)
+    return sig.tolist()
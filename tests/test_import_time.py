@@ -0,0 +1,60 @@
+"""app.py 콜드 스타트 import 시간 회귀 테스트 (`python -X importtime` 기반)
+
+실행: python -m pytest -q tests
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# `import app` 누적 import 시간 예산 (마이크로초). 측정값 약 0.73초 + 여유 약 35%.
+# 이 값에는 streamlit·plotly·dotenv import와, bare 모드에서 st.stop()이 멈추지 않아
+# 끝까지 실행되는 app.py 스크립트 본문(init_db, 반복 태스크 생성, 목록 조회)이 모두 포함됨.
+# 빈 임시 DB 기준이므로 실제 DB 크기에 따른 시간은 반영되지 않음
+IMPORT_TIME_BUDGET_US = 1_000_000
+
+# 콜드 스타트에서 로드되면 안 되는 무거운 모듈 (분류 요청 시에만 로드)
+LAZY_MODULES = ("openai",)
+
+
+def _importtime(code: str, cwd: Path) -> dict[str, int]:
+    """-X importtime 출력에서 최상위 모듈별 누적 시간(µs)과 로드된 모듈 이름을 수집"""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.fixture(scope="module")
+def app_imports(tmp_path_factory) -> dict[str, int]:
+    # bare 모드에서는 st.stop()이 스크립트를 멈추지 않아 DB가 생길 수 있으므로 임시 폴더에서 실행
+    return _importtime("import app", tmp_path_factory.mktemp("coldstart"))
+
+
+def test_heavy_modules_are_lazy(app_imports):
+    for name in LAZY_MODULES:
+        loaded = [m for m in app_imports if m == name or m.startswith(name + ".")]
+        assert not loaded, f"{name}이(가) 콜드 스타트에 로드됨: {loaded[:5]}"
+
+
+def test_import_time_budget(app_imports):
+    total = app_imports["app"]
+    assert total <= IMPORT_TIME_BUDGET_US, (
+        f"import app: {total / 1000:.0f}ms > 예산 {IMPORT_TIME_BUDGET_US / 1000:.0f}ms"
+    )
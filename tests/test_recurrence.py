@@ -0,0 +1,140 @@
+"""recurrence.py 규칙 해석·날짜 전개와 반복 태스크 생성의 멱등성 테스트
+
+실행: python -m pytest -q tests
+"""
+from datetime import date, timedelta
+
+import pytest
+
+import database
+import recurrence
+from models import RecurringTemplate
+
+
+def _dates(rule: str, start: date, after: date, until: date) -> list[date]:
+    return recurrence.occurrences(recurrence.parse_rule(rule), start, after, until)
+
+
+@pytest.mark.parametrize("text", [
+    "FREQ=DAILY;BYDAY=MO",
+    "FREQ=MONTHLY;BYDAY=MO",
+    "FREQ=YEARLY;BYDAY=MO",
+    "FREQ=WEEKLY;BYMONTHDAY=5",
+    "FREQ=YEARLY;BYMONTHDAY=5",
+    "FREQ=DAILY;BYMONTHDAY=1",
+    "BYDAY=MO;FREQ=MONTHLY",
+    "BYDAY=MO",
+    "FREQ=WEEKLY;BYDAY=XX",
+    "FREQ=MONTHLY;BYMONTHDAY=0",
+    "FREQ=WEEKLY;INTERVAL=0",
+    "FREQ=WEEKLY;COUNT=0",
+    "FREQ=HOURLY",
+])
+def test_parse_rule_rejects_unsupported(text):
+    with pytest.raises(ValueError):
+        recurrence.parse_rule(text)
+
+
+@pytest.mark.parametrize("rule, start", [
+    ("FREQ=DAILY;INTERVAL=3", date(2026, 1, 5)),
+    ("FREQ=WEEKLY;BYDAY=MO,TH", date(2026, 1, 7)),
+    ("FREQ=WEEKLY;INTERVAL=2;BYDAY=SU", date(2026, 3, 1)),
+    ("FREQ=MONTHLY;BYMONTHDAY=1,15,-1", date(2026, 1, 20)),
+    ("FREQ=MONTHLY;INTERVAL=2", date(2026, 1, 31)),
+    ("FREQ=YEARLY", date(2024, 2, 29)),
+])
+def test_window_skipping_matches_full_expansion(rule, start):
+    until = date(2030, 12, 31)
+    full = _dates(rule, start, start - timedelta(days=1), until)
+    assert full
+    for offset in (0, 1, 6, 30, 59, 200, 400, 1000):
+        after = start + timedelta(days=offset)
+        assert _dates(rule, start, after, until) == [d for d in full if d > after]
+
+
+def test_count_is_counted_from_start():
+    start = date(2026, 1, 5)  # 월요일
+    assert _dates("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3", start, start - timedelta(days=1), date(2027, 1, 1)) == [
+        date(2026, 1, 5), date(2026, 1, 7), date(2026, 1, 12),
+    ]
+    # 이미 지난 횟수도 COUNT에 포함
+    assert _dates("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3", start, date(2026, 1, 6), date(2027, 1, 1)) == [
+        date(2026, 1, 7), date(2026, 1, 12),
+    ]
+
+
+def test_until_is_inclusive():
+    start = date(2026, 1, 1)
+    assert _dates("FREQ=DAILY;UNTIL=2026-01-03", start, start - timedelta(days=1), date(2026, 12, 31)) == [
+        date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3),
+    ]
+    assert _dates("FREQ=DAILY;UNTIL=20260102", start, start - timedelta(days=1), date(2026, 12, 31)) == [
+        date(2026, 1, 1), date(2026, 1, 2),
+    ]
+
+
+def test_month_end():
+    start = date(2028, 1, 31)
+    assert _dates("FREQ=MONTHLY;BYMONTHDAY=-1", start, start - timedelta(days=1), date(2028, 4, 30)) == [
+        date(2028, 1, 31), date(2028, 2, 29), date(2028, 3, 31), date(2028, 4, 30),
+    ]
+    # 31일이 없는 달은 건너뜀
+    assert _dates("FREQ=MONTHLY", start, start - timedelta(days=1), date(2028, 5, 31)) == [
+        date(2028, 1, 31), date(2028, 3, 31), date(2028, 5, 31),
+    ]
+
+
+def test_feb_29_only_in_leap_years():
+    start = date(2024, 2, 29)
+    assert _dates("FREQ=YEARLY", start, start - timedelta(days=1), date(2032, 12, 31)) == [
+        date(2024, 2, 29), date(2028, 2, 29), date(2032, 2, 29),
+    ]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "tasks.db"))
+    database.init_db()
+
+
+def _count_tasks() -> int:
+    conn = database.get_conn()
+    n = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+    conn.close()
+    return n
+
+
+def test_materialize_is_idempotent(db):
+    today = date(2026, 1, 1)
+    tid = database.add_template(RecurringTemplate(title="주간 회의", rrule="FREQ=DAILY", start_date=today))
+
+    created = database.materialize_recurring_tasks(horizon_days=9, today=today)
+    assert created == 10
+    assert database.materialize_recurring_tasks(horizon_days=9, today=today) == 0
+
+    # materialized_until을 잃어도 (template_id, due_date) 유니크 제약으로 중복 생성되지 않음
+    conn = database.get_conn()
+    conn.execute("UPDATE recurring_templates SET materialized_until = NULL WHERE id = ?", (tid,))
+    conn.commit()
+    conn.close()
+    assert database.materialize_recurring_tasks(horizon_days=9, today=today) == 0
+    assert _count_tasks() == 10
+
+    # 기간이 늘어난 만큼만 추가
+    assert database.materialize_recurring_tasks(horizon_days=9, today=today + timedelta(days=2)) == 2
+    assert _count_tasks() == 12
+
+
+def test_materialize_skips_templates_with_invalid_rule(db):
+    today = date(2026, 1, 1)
+    conn = database.get_conn()
+    conn.execute(
+        """INSERT INTO recurring_templates (title, rrule, start_date, active)
+           VALUES ('잘못된 규칙', 'FREQ=MONTHLY;BYDAY=MO', ?, 1)""",
+        (today.isoformat(),),
+    )
+    conn.commit()
+    conn.close()
+    database.add_template(RecurringTemplate(title="매일", rrule="FREQ=DAILY", start_date=today))
+
+    assert database.materialize_recurring_tasks(horizon_days=2, today=today) == 3